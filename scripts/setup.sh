@@ -8,7 +8,7 @@ if [ ! -d ../${venv_name} ]; then
   pyenv install 3.11 --skip-existing
   pyenv local 3.11
   python3 -m venv ${venv_name}
-  poetry install
+  ./${venv_name}/bin/pip install -r ../requirements-dev.txt
 fi
 
 source ./${venv_name}/bin/activate
@@ -1,12 +1,64 @@
 import functools
 from typing import List
 
+from cocotb.triggers import Timer
+
+
+async def drive_serial(
+    signal, bits: List[int], cycles_per_bit: int, clock_period_ns: int
+):
+    """
+    Drive a batch of bits onto a serial signal.
+
+    Each bit is applied immediately and held for a fixed number of clock
+    cycles, using a single timed await per bit instead of a callback per
+    clock edge.
+
+    Args:
+      signal: The handle of the signal to drive.
+      bits (List[int]): The bits to drive, in wire order.
+      cycles_per_bit (int): The number of clock cycles to hold each bit.
+      clock_period_ns (int): The clock period in nanoseconds.
+    """
+    bit_period_ns = cycles_per_bit * clock_period_ns
+    for bit in bits:
+        signal.setimmediatevalue(bit)
+        await Timer(bit_period_ns, "ns")
+
+
+async def sample_serial(
+    signal, num_bits: int, cycles_per_bit: int, clock_period_ns: int
+) -> List[int]:
+    """
+    Sample a serial signal once per bit period.
+
+    Samples are collected into a list so a caller can compare a whole
+    frame at once instead of asserting per bit.
+
+    Args:
+      signal: The handle of the signal to sample.
+      num_bits (int): The number of bits to sample.
+      cycles_per_bit (int): The number of clock cycles per bit.
+      clock_period_ns (int): The clock period in nanoseconds.
+
+    Returns:
+      The sampled bits, in wire order.
+    """
+    bit_period_ns = cycles_per_bit * clock_period_ns
+    bits = []
+    for _ in range(0, num_bits):
+        await Timer(bit_period_ns, "ns")
+        bits.append(int(signal.value))
+    return bits
+
 
 def repeat(num_repeats: int):
     """
     Repeat a cocotb test a specified amount of times.
 
-    Useful for repeated random testing.
+    Useful for repeated random testing. The wrapper is a native async
+    coroutine, so repeats avoid the legacy generator-based coroutine
+    overhead.
 
     Args:
       num_repeats (int): The number of times to repeat a test.
@@ -2,16 +2,40 @@
 Runner for cocotb-test for consistent params for all tests.
 """
 
+import hashlib
+import os
+from pathlib import Path
 from typing import List, Dict
 import cocotb_test.simulator
 
 from hardware.util.path import resolve_module_path, get_project_root
 
 
+def _hash_sources(srcs: List[str]) -> str:
+    """
+    Return a content hash over a list of source files.
+
+    Args:
+      srcs (List[str]): The paths of the source files to hash.
+    """
+    digest = hashlib.sha256()
+    for src in srcs:
+        digest.update(Path(src).read_bytes())
+    return digest.hexdigest()
+
+
 def run_cocotb(top: str, deps: List[str], parameters: Dict[str, str] = None):
     """
     Run cocotb-test with specified params.
 
+    Compilation is skipped when the build directory already holds a build
+    of the same source content, so repeated invocations only pay
+    elaboration once.
+
+    Waveform dumping is disabled unless the WAVES environment variable is
+    set, since dumping every transition dominates simulator runtime for
+    high-activity tests.
+
     Args:
       top (str): The name of the top level module to test.
       deps (List[str]): A list of module dependencies to the top level module.
@@ -22,13 +46,25 @@ def run_cocotb(top: str, deps: List[str], parameters: Dict[str, str] = None):
     if top.endswith(".sv"):
         top = top[:-3]
     srcs = [str(resolve_module_path(src)) for src in ([top] + deps)]
+    sim_build = get_project_root().joinpath(
+        f"sim_build/{top}/"
+        + "_".join(f"{item[0]}={item[1]}" for item in parameters.items())
+    )
+
+    # only recompile when the source content or waveform setting changes;
+    # icarus compiles the waveform dump module into the build
+    waves = bool(int(os.environ.get("WAVES", "0")))
+    sources_hash = f"{_hash_sources(srcs)}-waves={int(waves)}"
+    hash_file = sim_build.joinpath("sources.sha256")
+    force_compile = not (hash_file.exists() and hash_file.read_text() == sources_hash)
+
     cocotb_test.simulator.run(
         verilog_sources=srcs,
         toplevel=top,
         module=f"test_{top}",
         python_search=[str(get_project_root().joinpath("hardware/verif/py"))],
         toplevel_lang="verilog",
-        force_compile=True,
+        force_compile=force_compile,
         verilog_compile_args=[
             "-g2012",
             "-Wall",
@@ -42,11 +78,9 @@ def run_cocotb(top: str, deps: List[str], parameters: Dict[str, str] = None):
         ],
         simulator="icarus",
         parameters=parameters,
-        waves=True,
-        sim_build=(
-            get_project_root().joinpath(
-                f"sim_build/{top}/"
-                + "_".join(f"{item[0]}={item[1]}" for item in parameters.items())
-            )
-        ),
+        waves=waves,
+        sim_build=sim_build,
     )
+
+    if force_compile:
+        hash_file.write_text(sources_hash)
@@ -5,7 +5,7 @@ Tests for I2C module.
 import random
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge
+from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge, Timer, with_timeout
 
 import hardware.verif.py.cocotb_runner
 
@@ -31,11 +31,14 @@ async def i2c_random_receive(dut, bit_depth: int = None):
 
     # reset
     dut.rst_n.value = 0
-    await ClockCycles(signal=dut.clk, num_cycles=200, rising=True)
+    await Timer(200 * clock_period_ns, "ns")
     dut.rst_n.value = 1
 
-    dut.read_ready = 1
-    await ClockCycles(signal=dut.clk, num_cycles=50000, rising=True)
+    # await a read, with the old 50000 cycle burn as a timeout bound
+    dut.read_ready.setimmediatevalue(1)
+    await with_timeout(
+        RisingEdge(signal=dut.read_valid), 50000 * clock_period_ns, "ns"
+    )
 
 
 def test_i2c():
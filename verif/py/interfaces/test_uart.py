@@ -5,11 +5,11 @@ Tests for UART module.
 import random
 import cocotb
 from cocotb.clock import Clock
-from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge
+from cocotb.triggers import ClockCycles, RisingEdge, FallingEdge, Timer
 
 import hardware.verif.py.cocotb_runner
 
-from hardware.util.verif import repeat, parameterize
+from hardware.util.verif import repeat, parameterize, drive_serial, sample_serial
 
 
 @cocotb.test()
@@ -20,14 +20,15 @@ async def uart_random_receive(dut, buffer_width: int = None):
     """
     # setup module parameters and variables
     buffer_width = 8
+    cycles_per_bit = int(dut.CLK_CYCLES_PER_BIT.value)
 
     # setup clock
-    clock_period_ns = int(1e9 / dut.CLK_FREQ.value)
+    clock_period_ns = int(1e9 / int(dut.CLK_FREQ.value))
     clock = Clock(signal=dut.clk, period=clock_period_ns, units="ns")
     await cocotb.start(clock.start())
 
     # setup inputs
-    dut.rx.value = 1  # UART idle high
+    dut.rx.setimmediatevalue(1)  # UART idle high
 
     # reset
     dut.rst_n.value = 0
@@ -36,31 +37,29 @@ async def uart_random_receive(dut, buffer_width: int = None):
     await ClockCycles(signal=dut.clk, num_cycles=2, rising=True)
 
     # start bit
-    dut.rx.value = 0
-    await ClockCycles(
-        signal=dut.clk, num_cycles=dut.CLK_CYCLES_PER_BIT.value, rising=True
-    )
+    dut.rx.setimmediatevalue(0)
+    await Timer(cycles_per_bit * clock_period_ns, "ns")
 
     # read bits
     read_data = random.randint(0, 2**buffer_width - 1)
-    for index in range(0, 8):
-        dut.rx.value = (read_data >> index) & 0b1
-        await ClockCycles(
-            signal=dut.clk, num_cycles=dut.CLK_CYCLES_PER_BIT.value, rising=True
-        )
+    read_bits = [(read_data >> index) & 0b1 for index in range(0, buffer_width)]
+    await drive_serial(
+        signal=dut.rx,
+        bits=read_bits,
+        cycles_per_bit=cycles_per_bit,
+        clock_period_ns=clock_period_ns,
+    )
 
     # assert read data and read valid
     assert dut.read_data.value == read_data
     # assert dut.read_valid.value == 1 #TODO: fix
 
     # stop bit
-    dut.rx.value = 1
-    await ClockCycles(
-        signal=dut.clk, num_cycles=dut.CLK_CYCLES_PER_BIT.value, rising=True
-    )
+    dut.rx.setimmediatevalue(1)
+    await Timer(cycles_per_bit * clock_period_ns, "ns")
 
     # idle and cooldown
-    await ClockCycles(signal=dut.clk, num_cycles=5)
+    await Timer(5 * clock_period_ns, "ns")
 
 
 @cocotb.test()
@@ -72,10 +71,11 @@ async def uart_random_transmit(dut):
     # setup module parameters and variables
     buffer_width = 8
     write_data = random.randint(0, 2**buffer_width - 1)
-    clk_cycles_till_sample = int(dut.CLK_CYCLES_PER_BIT.value / 2)
+    cycles_per_bit = int(dut.CLK_CYCLES_PER_BIT.value)
+    clk_cycles_till_sample = cycles_per_bit // 2
 
     # setup clock
-    clock_period_ns = int(1e9 / dut.CLK_FREQ.value)
+    clock_period_ns = int(1e9 / int(dut.CLK_FREQ.value))
     clock = Clock(signal=dut.clk, period=clock_period_ns, units="ns")
     await cocotb.start(clock.start())
 
@@ -97,9 +97,14 @@ async def uart_random_transmit(dut):
     assert dut.tx.value == 0
 
     # write bits
-    for index in range(0, 8):
-        await ClockCycles(signal=dut.clk, num_cycles=dut.CLK_CYCLES_PER_BIT.value)
-        assert dut.tx.value == (write_data >> index) & 0b1
+    write_bits = [(write_data >> index) & 0b1 for index in range(0, buffer_width)]
+    sampled_bits = await sample_serial(
+        signal=dut.tx,
+        num_bits=buffer_width,
+        cycles_per_bit=cycles_per_bit,
+        clock_period_ns=clock_period_ns,
+    )
+    assert sampled_bits == write_bits
     await ClockCycles(signal=dut.clk, num_cycles=clk_cycles_till_sample)
 
     # stop transmit
@@ -110,7 +115,7 @@ async def uart_random_transmit(dut):
     assert dut.tx.value == 0b1
 
     # idle and cooldown
-    await ClockCycles(signal=dut.clk, num_cycles=5)
+    await Timer(5 * clock_period_ns, "ns")
 
 
 @cocotb.test()
@@ -122,15 +127,16 @@ async def uart_random_full_duplex(dut):
     # setup module parameters and variables
     buffer_width = 8
     write_data = random.randint(0, 2**buffer_width - 1)
-    clk_cycles_till_sample = int(dut.CLK_CYCLES_PER_BIT.value / 2)
+    cycles_per_bit = int(dut.CLK_CYCLES_PER_BIT.value)
 
     # setup clock
-    clock_period_ns = int(1e9 / dut.CLK_FREQ.value)
+    clock_period_ns = int(1e9 / int(dut.CLK_FREQ.value))
+    bit_period_ns = cycles_per_bit * clock_period_ns
     clock = Clock(signal=dut.clk, period=clock_period_ns, units="ns")
     await cocotb.start(clock.start())
 
     # setup inputs
-    dut.rx.value = 1  # UART idle high
+    dut.rx.setimmediatevalue(1)  # UART idle high
 
     # reset
     dut.rst_n.value = 0
@@ -145,31 +151,37 @@ async def uart_random_full_duplex(dut):
     dut.write_valid.value = 1
 
     # start bit
-    dut.rx.value = 0
+    dut.rx.setimmediatevalue(0)
     await FallingEdge(signal=dut.tx)
-    await ClockCycles(signal=dut.clk, num_cycles=clk_cycles_till_sample)
+    await Timer(bit_period_ns // 2, "ns")
     assert dut.tx.value == 0
 
     # read and write bits
     read_data = random.randint(0, 2**buffer_width - 1)
+    read_bits = [(read_data >> index) & 0b1 for index in range(0, buffer_width)]
+    rx = dut.rx
+    tx = dut.tx
+    sampled_data = 0
     for index in range(0, 8):
-        await ClockCycles(signal=dut.clk, num_cycles=clk_cycles_till_sample)
-        dut.rx.value = (read_data >> index) & 0b1
-        await ClockCycles(signal=dut.clk, num_cycles=clk_cycles_till_sample)
-        assert dut.tx.value == (write_data >> index) & 0b1
-    await ClockCycles(signal=dut.clk, num_cycles=clk_cycles_till_sample)
-
-    # stop transmit and assert read data
+        # apply rx on the bit boundary, sample tx mid bit
+        await Timer(bit_period_ns // 2, "ns")
+        rx.setimmediatevalue(read_bits[index])
+        await Timer(bit_period_ns - bit_period_ns // 2, "ns")
+        sampled_data |= int(tx.value) << index
+    await Timer(bit_period_ns // 2, "ns")
+
+    # stop transmit and assert read and write data
     dut.write_valid.value = 0
+    assert sampled_data == write_data
     assert dut.read_data.value == read_data
 
     # stop bit
-    await ClockCycles(signal=dut.clk, num_cycles=clk_cycles_till_sample)
+    await Timer(bit_period_ns // 2, "ns")
     assert dut.tx.value == 0b1
 
     # idle and cooldown
-    dut.rx.value = 1
-    await ClockCycles(signal=dut.clk, num_cycles=5)
+    dut.rx.setimmediatevalue(1)
+    await Timer(5 * clock_period_ns, "ns")
 
 
 def test_uart():